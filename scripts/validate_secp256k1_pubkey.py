@@ -8,6 +8,7 @@ equation: y² = x³ + 7 (mod p)
 
 Usage:
     python validate_secp256k1_pubkey.py <pubkey_hex>
+    python validate_secp256k1_pubkey.py --batch <file>
 
 Examples:
     # Valid compressed public key
@@ -17,11 +18,40 @@ Examples:
     # Invalid/fake public key (data-carrying)
     python validate_secp256k1_pubkey.py \\
         02660224cd2ffbf92fada23aa883f0c51f2d55ae13394a40d6538ff2a63d0dce00
+
+    # Validate one public key per line, printing "<pubkey_hex>\\t<True|False>"
+    python validate_secp256k1_pubkey.py --batch pubkeys.txt
+
+If the optional `coincurve` package (libsecp256k1 bindings) is installed, the
+parse and on-curve check is done in C; otherwise the pure-Python fallback is used,
+with `gmpy2` (GMP) doing the modular exponentiation when it is available.
 """
 
+__all__ = ["is_valid_pubkey", "is_valid_pubkey_batch"]
+
+try:
+    from coincurve import PublicKey
+except ImportError:
+    PublicKey = None
+
+try:
+    from gmpy2 import mpz, powmod
+except ImportError:
+    mpz, powmod = int, pow
+
 # secp256k1 curve prime
 p = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 
+# Curve constant b in y² = x³ + b
+B = 7
+
+# Curve prime and square-root exponent as GMP integers (plain ints without gmpy2)
+P = mpz(p)
+EXP = mpz((p + 1) // 4)
+
+# Valid prefixes for compressed public keys (0x02 = even y, 0x03 = odd y)
+COMPRESSED_PREFIXES = frozenset((0x02, 0x03))
+
 
 def is_valid_pubkey(pubkey_hex):
     """
@@ -43,55 +73,118 @@ def is_valid_pubkey(pubkey_hex):
         return False
 
     if len(pub_bytes) == 33:  # Compressed public key
-        prefix, x = pub_bytes[0], int.from_bytes(pub_bytes[1:], 'big')
-
         # Check prefix is valid (must be 0x02 or 0x03)
-        if prefix not in (0x02, 0x03):
+        if pub_bytes[0] not in COMPRESSED_PREFIXES:
             return False
 
-        # Calculate y² = x³ + 7 (mod p)
-        y_squared = (pow(x, 3, p) + 7) % p
+        if PublicKey is not None:
+            return _libsecp256k1_parses(pub_bytes)
 
-        # Calculate y using Tonelli-Shanks algorithm
-        # For secp256k1: y = y_squared^((p+1)/4) mod p
-        y = pow(y_squared, (p + 1) // 4, p)
+        x = mpz(int.from_bytes(pub_bytes[1:], 'big'))
 
-        # Verify y² = y_squared (mod p)
-        if pow(y, 2, p) != y_squared:
+        # Coordinates must be field elements; reject before any modexp
+        if x >= P:
             return False
 
-        # For any valid x, there are two valid y values: y and p - y (they have opposite parity)
-        # If the calculated y doesn't match the prefix parity, use the other root
-        # 0x02 = even y, 0x03 = odd y
-        if (y % 2 == 1) == (prefix == 0x02):
-            y = p - y
+        # Calculate y² = x³ + 7 (mod p)
+        y_squared = (powmod(x, 3, P) + B) % P
 
-        # Verify the final y matches the expected parity
-        return (y % 2 == 0) == (prefix == 0x02)
+        # Calculate y using Tonelli-Shanks algorithm
+        # For secp256k1: y = y_squared^((p+1)/4) mod p
+        y = powmod(y_squared, EXP, P)
+
+        # Verify y² = y_squared (mod p); a plain multiply is much cheaper than a modexp
+        # No parity check is needed: for any valid x, both y and p - y are roots with
+        # opposite parity (y is never 0 on secp256k1), so either prefix is satisfiable
+        return y * y % P == y_squared
 
     elif len(pub_bytes) == 65:  # Uncompressed public key
         # First byte must be 0x04
         if pub_bytes[0] != 0x04:
             return False
 
-        x = int.from_bytes(pub_bytes[1:33], 'big')
-        y = int.from_bytes(pub_bytes[33:], 'big')
+        if PublicKey is not None:
+            return _libsecp256k1_parses(pub_bytes)
+
+        x = mpz(int.from_bytes(pub_bytes[1:33], 'big'))
+        y = mpz(int.from_bytes(pub_bytes[33:], 'big'))
+
+        # Coordinates must be field elements; reject before any modexp
+        if x >= P or y >= P:
+            return False
 
         # Verify the curve equation: y² = x³ + 7 (mod p)
-        return (pow(y, 2, p) - pow(x, 3, p) - 7) % p == 0
+        return (powmod(y, 2, P) - powmod(x, 3, P) - B) % P == 0
 
     return False
 
 
-def main():
-    """Command-line interface for the validator."""
+def is_valid_pubkey_batch(pubkey_hexes):
+    """
+    Check many public keys in one call.
+
+    Args:
+        pubkey_hexes: Iterable of public key hex strings
+
+    Returns:
+        list[bool]: Validity of each public key, in input order
+    """
+    return [is_valid_pubkey(pubkey_hex) for pubkey_hex in pubkey_hexes]
+
+
+def _libsecp256k1_parses(pub_bytes):
+    """
+    Check a length/prefix-validated public key with libsecp256k1.
+
+    The prefix guard in is_valid_pubkey must run first: secp256k1_ec_pubkey_parse
+    also accepts the hybrid 0x06/0x07 encoding, which we treat as invalid.
+    """
+    try:
+        PublicKey(pub_bytes)
+    except ValueError:
+        return False
+    return True
+
+
+def main(argv=None):
+    """
+    Command-line interface for the validator.
+
+    Args:
+        argv: Argument list excluding the program name (defaults to sys.argv[1:])
+
+    Returns:
+        int: Exit status (0 if every public key is valid, 1 otherwise)
+    """
     import sys
 
-    if len(sys.argv) != 2:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] == '--batch':
+        if len(argv) != 2:
+            print(__doc__)
+            return 1
+
+        try:
+            with open(argv[1]) as f:
+                pubkey_hexes = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"Error: cannot read {argv[1]}: {e.strerror}", file=sys.stderr)
+            return 1
+
+        results = is_valid_pubkey_batch(pubkey_hexes)
+
+        for pubkey_hex, is_valid in zip(pubkey_hexes, results):
+            print(f"{pubkey_hex}\t{is_valid}")
+
+        return 0 if all(results) else 1
+
+    if len(argv) != 1:
         print(__doc__)
-        sys.exit(1)
+        return 1
 
-    pubkey_hex = sys.argv[1]
+    pubkey_hex = argv[0]
 
     is_valid = is_valid_pubkey(pubkey_hex)
 
@@ -103,8 +196,10 @@ def main():
     else:
         print("✗ This is NOT a valid public key (likely data-carrying)")
 
-    sys.exit(0 if is_valid else 1)
+    return 0 if is_valid else 1
 
 
 if __name__ == "__main__":
-    main()
+    import sys
+
+    sys.exit(main())
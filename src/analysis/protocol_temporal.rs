@@ -21,7 +21,7 @@ use crate::types::analysis_results::{ProtocolTemporalReport, ProtocolTotal, Week
 use crate::types::visualisation::{get_protocol_colour, PlotlyChart, PlotlyLayout, PlotlyTrace};
 use crate::types::ProtocolType;
 use crate::utils::time::week_bucket_dates;
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
 use std::str::FromStr;
 
 /// Analyse temporal distribution of P2MS protocols
@@ -139,26 +139,29 @@ pub fn analyse_temporal_distribution(db: &Database) -> AppResult<ProtocolTempora
 impl ProtocolTemporalReport {
     /// Generate Plotly chart from this report
     pub fn to_plotly_chart(&self) -> PlotlyChart {
-        // Group weekly data by protocol
-        let mut protocol_weekly: HashMap<ProtocolType, Vec<(String, f64)>> = HashMap::new();
+        // Index weeks once (ordered by bucket) so each protocol's y-values are filled
+        // by position, rather than building and probing an ISO-date map per protocol
+        let weeks: BTreeMap<i64, &str> = self
+            .weekly_data
+            .iter()
+            .map(|w| (w.week_bucket, w.week_start_iso.as_str()))
+            .collect();
+        let week_index: HashMap<i64, usize> = weeks
+            .keys()
+            .enumerate()
+            .map(|(idx, bucket)| (*bucket, idx))
+            .collect();
+        let all_weeks: Vec<String> = weeks.values().map(|iso| iso.to_string()).collect();
 
+        // Per-protocol y-values for every week (0 if no data for that week)
+        let mut protocol_weekly: HashMap<ProtocolType, Vec<f64>> = HashMap::new();
         for week in &self.weekly_data {
-            protocol_weekly
+            let y_values = protocol_weekly
                 .entry(week.protocol)
-                .or_default()
-                .push((week.week_start_iso.clone(), week.count as f64));
+                .or_insert_with(|| vec![0.0; all_weeks.len()]);
+            y_values[week_index[&week.week_bucket]] += week.count as f64;
         }
 
-        // Get sorted list of all weeks
-        let mut all_weeks: Vec<String> = self
-            .weekly_data
-            .iter()
-            .map(|w| w.week_start_iso.clone())
-            .collect::<std::collections::HashSet<_>>()
-            .into_iter()
-            .collect();
-        all_weeks.sort();
-
         // Create traces ordered by protocol enum order
         let mut traces: Vec<PlotlyTrace> = Vec::new();
 
@@ -168,16 +171,9 @@ impl ProtocolTemporalReport {
             let display_name = protocol.display_name();
             let colour = get_protocol_colour(protocol);
 
-            // Build y-values for each week (0 if no data for that week)
-            let week_data = protocol_weekly.get(&protocol);
-            let week_map: HashMap<String, f64> = week_data
-                .map(|data| data.iter().cloned().collect())
-                .unwrap_or_default();
-
-            let y_values: Vec<f64> = all_weeks
-                .iter()
-                .map(|week| *week_map.get(week).unwrap_or(&0.0))
-                .collect();
+            let y_values = protocol_weekly
+                .remove(&protocol)
+                .unwrap_or_else(|| vec![0.0; all_weeks.len()]);
 
             let trace = PlotlyTrace::bar(all_weeks.clone(), y_values, display_name, colour);
             traces.push(trace);
@@ -212,4 +208,43 @@ mod tests {
         assert!(chart.data.is_empty());
         assert_eq!(chart.layout.barmode, Some("stack".to_string()));
     }
+
+    fn week(bucket: i64, iso: &str, protocol: ProtocolType, count: usize) -> WeeklyProtocolStats {
+        WeeklyProtocolStats {
+            week_bucket: bucket,
+            week_start_iso: iso.to_string(),
+            week_end_iso: String::new(),
+            protocol,
+            count,
+            value_sats: 0,
+        }
+    }
+
+    #[test]
+    fn test_plotly_fills_missing_weeks_with_zero() {
+        let report = ProtocolTemporalReport {
+            protocol_totals: vec![
+                ProtocolTotal {
+                    protocol: ProtocolType::BitcoinStamps,
+                    ..Default::default()
+                },
+                ProtocolTotal {
+                    protocol: ProtocolType::Counterparty,
+                    ..Default::default()
+                },
+            ],
+            weekly_data: vec![
+                week(2, "2024-01-11", ProtocolType::BitcoinStamps, 5),
+                week(1, "2024-01-04", ProtocolType::Counterparty, 3),
+                week(2, "2024-01-11", ProtocolType::Counterparty, 7),
+            ],
+            ..Default::default()
+        };
+
+        let chart = report.to_plotly_chart();
+        assert_eq!(chart.data.len(), 2);
+        assert_eq!(chart.data[0].x, vec!["2024-01-04", "2024-01-11"]);
+        assert_eq!(chart.data[0].y, vec![0.0, 5.0]);
+        assert_eq!(chart.data[1].y, vec![3.0, 7.0]);
+    }
 }
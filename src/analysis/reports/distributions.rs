@@ -3,7 +3,7 @@
 //! Provides formatting for transaction sizes, P2MS output counts, dust analysis,
 //! and multisig configuration reports.
 
-use super::utils::{export_json, format_bytes, format_number};
+use super::utils::{export_json, export_plotly_json, format_bytes, format_number};
 use super::OutputFormat;
 use crate::analysis::tx_size_analysis::TX_SIZE_BUCKET_RANGES;
 use crate::errors::AppResult;
@@ -27,7 +27,7 @@ pub fn format_tx_sizes(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
@@ -174,7 +174,7 @@ pub fn format_output_count_distribution(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
@@ -3,7 +3,7 @@
 //! Provides formatting for spendability statistics, data size by spendability,
 //! and temporal spendability distribution.
 
-use super::utils::{export_json, format_bytes, format_number};
+use super::utils::{export_json, export_plotly_json, format_bytes, format_number};
 use super::OutputFormat;
 use crate::errors::AppResult;
 use crate::types::analysis_results::{
@@ -184,7 +184,7 @@ pub fn format_spendability_temporal(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart: PlotlyChart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
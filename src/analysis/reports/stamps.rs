@@ -3,7 +3,7 @@
 //! Provides formatting for Bitcoin Stamps transport analysis, signature variants,
 //! variant temporal distribution, and weekly fee analysis.
 
-use super::utils::{export_json, format_number};
+use super::utils::{export_json, export_plotly_json, format_number};
 use super::OutputFormat;
 use crate::analysis::stamps_signature_stats::StampsSignatureAnalysis;
 use crate::analysis::stamps_transport_stats::StampsTransportAnalysis;
@@ -160,7 +160,7 @@ pub fn format_stamps_weekly_fees(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart: PlotlyChart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
@@ -255,7 +255,7 @@ pub fn format_stamps_variant_temporal(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart: PlotlyChart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
@@ -2,7 +2,7 @@
 //!
 //! Provides formatting for protocol distribution over time analysis.
 
-use super::utils::{export_json, format_number};
+use super::utils::{export_json, export_plotly_json, format_number};
 use super::OutputFormat;
 use crate::errors::AppResult;
 use crate::types::analysis_results::ProtocolTemporalReport;
@@ -23,7 +23,7 @@ pub fn format_protocol_temporal(
         OutputFormat::Json => export_json(report),
         OutputFormat::Plotly => {
             let chart: PlotlyChart = report.to_plotly_chart();
-            export_json(&chart)
+            export_plotly_json(&chart)
         }
         OutputFormat::Console => {
             let mut output = String::new();
@@ -63,6 +63,15 @@ pub fn export_json<T: Serialize>(data: &T) -> AppResult<String> {
         .map_err(|e| crate::errors::AppError::Config(format!("JSON export failed: {}", e)))
 }
 
+/// Export a Plotly chart as compact JSON
+///
+/// Charts are consumed by plotting code rather than read by hand, so the
+/// indentation of `export_json` only inflates large trace arrays.
+pub fn export_plotly_json<T: Serialize>(chart: &T) -> AppResult<String> {
+    serde_json::to_string(chart)
+        .map_err(|e| crate::errors::AppError::Config(format!("Plotly JSON export failed: {}", e)))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
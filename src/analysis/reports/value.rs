@@ -3,7 +3,7 @@
 //! Provides formatting for value distribution analysis, including
 //! per-protocol breakdowns and Plotly-compatible visualisation data.
 
-use super::utils::{export_json, format_number};
+use super::utils::{export_json, export_plotly_json, format_number};
 use super::OutputFormat;
 use crate::errors::AppResult;
 use crate::types::analysis_results::{ValueAnalysisReport, ValueDistributionReport};
@@ -381,6 +381,5 @@ fn export_plotly_value_distributions(report: &ValueDistributionReport) -> AppRes
         layout,
     };
 
-    serde_json::to_string_pretty(&chart)
-        .map_err(|e| crate::errors::AppError::Config(format!("Plotly JSON export failed: {}", e)))
+    export_plotly_json(&chart)
 }
@@ -1,7 +1,8 @@
 use crate::config::AppConfig;
 use crate::errors::{AppError, AppResult};
 use clap::{Args, Subcommand};
-use std::path::PathBuf;
+use std::io::Write;
+use std::path::{Path, PathBuf};
 
 use crate::analysis::{AnalysisEngine, OutputFormat, ReportFormatter};
 
@@ -33,15 +34,38 @@ fn parse_format(format_str: &str) -> OutputFormat {
 }
 
 /// Write output to file with safe directory creation
+///
+/// The content is written and fsynced to a per-process sibling temp file, then
+/// renamed into place. Readers of the output path see either the previous
+/// report or the complete new one, never a partial write. If writing or
+/// renaming fails, the temp file is removed.
 fn write_output_to_file(path: &PathBuf, content: &str, description: &str) -> AppResult<()> {
     if let Some(parent) = path.parent() {
         std::fs::create_dir_all(parent)?;
     }
-    std::fs::write(path, content)?;
+
+    // Include the PID so concurrent runs writing the same report don't share a temp file
+    let mut tmp_path = path.clone().into_os_string();
+    tmp_path.push(format!(".{}.tmp", std::process::id()));
+    let tmp_path = PathBuf::from(tmp_path);
+
+    let result = write_synced(&tmp_path, content).and_then(|()| std::fs::rename(&tmp_path, path));
+    if let Err(e) = result {
+        let _ = std::fs::remove_file(&tmp_path);
+        return Err(e.into());
+    }
+
     println!("{} written to: {}", description, path.display());
     Ok(())
 }
 
+/// Write content to a new file and flush it to disk
+fn write_synced(path: &Path, content: &str) -> std::io::Result<()> {
+    let mut file = std::fs::File::create(path)?;
+    file.write_all(content.as_bytes())?;
+    file.sync_all()
+}
+
 /// Run a simple analysis command (database_path + format only)
 fn run_simple_analysis<T, F, G>(
     database_path: &Option<PathBuf>,
@@ -880,3 +904,40 @@ pub fn run_analysis(analysis_type: &AnalysisCommands) -> AppResult<()> {
         ),
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn dir_entries(dir: &Path) -> Vec<String> {
+        let mut names: Vec<String> = std::fs::read_dir(dir)
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name().to_string_lossy().to_string())
+            .collect();
+        names.sort();
+        names
+    }
+
+    #[test]
+    fn test_write_output_to_file_replaces_existing_file() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let path = temp_dir.path().join("plots").join("report.json");
+
+        write_output_to_file(&path, "old", "Test report").unwrap();
+        write_output_to_file(&path, "new", "Test report").unwrap();
+
+        assert_eq!(std::fs::read_to_string(&path).unwrap(), "new");
+        assert_eq!(dir_entries(path.parent().unwrap()), vec!["report.json"]);
+    }
+
+    #[test]
+    fn test_write_output_to_file_removes_temp_on_failure() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        // A directory at the target path makes the final rename fail
+        let path = temp_dir.path().join("report.json");
+        std::fs::create_dir(&path).unwrap();
+
+        assert!(write_output_to_file(&path, "content", "Test report").is_err());
+        assert_eq!(dir_entries(temp_dir.path()), vec!["report.json"]);
+    }
+}
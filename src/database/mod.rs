@@ -32,6 +32,17 @@ use crate::errors::AppResult;
 use rusqlite::Connection;
 use tracing::info;
 
+/// Per-connection tuning for the large analytical scans run over the database
+///
+/// - `cache_size`: 256 MiB page cache (negative value = KiB) keeps hot index pages resident
+/// - `mmap_size`: memory-map up to 2 GiB of the file, avoiding a read/copy per page
+/// - `temp_store`: keep GROUP BY / ORDER BY temporaries in memory rather than temp files
+const CONNECTION_PRAGMAS: &str = r#"
+    PRAGMA cache_size = -262144;
+    PRAGMA mmap_size = 2147418112;
+    PRAGMA temp_store = MEMORY;
+"#;
+
 /// The main database interface that implements all stage operation traits.
 ///
 /// This struct directly holds a SQLite connection and provides all database
@@ -56,6 +67,7 @@ impl Database {
     /// initialised before Stage 1 processing begins.
     pub fn new(database_path: &str) -> AppResult<Self> {
         let connection = Connection::open(database_path)?;
+        connection.execute_batch(CONNECTION_PRAGMAS)?;
 
         // Initialise the schema
         setup_schema(&connection)?;
@@ -236,17 +236,37 @@ impl Stage2Processor {
             .get_heights_needing_block_info(&batch_heights)?;
 
         // Step 3: Fetch block info via RPC for heights that need updating
+        // Heights are independent, so fetch them concurrently up to the RPC client's limit
+        use futures::stream::StreamExt;
+
+        let concurrent_limit = self.rpc_client.get_concurrent_limit();
+        let rpc_client = &self.rpc_client;
+        let fetched: Vec<_> = futures::stream::iter(heights_needing_update.iter().copied())
+            .map(|height| async move {
+                let result = match rpc_client.get_block_hash(height as u64).await {
+                    Ok(block_hash) => {
+                        let block_info = rpc_client.get_block_header(&block_hash).await;
+                        Ok((block_hash, block_info))
+                    }
+                    Err(e) => Err(e),
+                };
+                (height, result)
+            })
+            .buffer_unordered(concurrent_limit)
+            .collect()
+            .await;
+
         let mut blocks_to_update: Vec<(u32, String, u64)> = Vec::new();
-        for height in &heights_needing_update {
+        for (height, result) in fetched {
             // Track RPC calls for block timestamp fetching
             stats.rpc_calls_made += 1;
-            match self.rpc_client.get_block_hash(*height as u64).await {
-                Ok(block_hash) => {
+            match result {
+                Ok((block_hash, block_info)) => {
                     stats.rpc_calls_made += 1;
-                    match self.rpc_client.get_block(&block_hash).await {
+                    match block_info {
                         Ok(block_info) => {
                             if let Some(time) = block_info["time"].as_u64() {
-                                blocks_to_update.push((*height, block_hash, time));
+                                blocks_to_update.push((height, block_hash, time));
                             } else {
                                 // Block JSON missing time field - unexpected but handle gracefully
                                 warn!(
@@ -257,7 +277,7 @@ impl Stage2Processor {
                             }
                         }
                         Err(e) => {
-                            warn!("Failed to fetch block {}: {}", block_hash, e);
+                            warn!("Failed to fetch block header {}: {}", block_hash, e);
                             stats.block_update_failures += 1;
                             stats.rpc_errors_encountered += 1;
                         }
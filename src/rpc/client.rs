@@ -33,6 +33,10 @@ pub enum RpcRequest {
         height: u64,
         tx: oneshot::Sender<RpcResult<String>>,
     },
+    GetBlockHeader {
+        block_hash: String,
+        tx: oneshot::Sender<RpcResult<serde_json::Value>>,
+    },
 }
 
 /// Bitcoin RPC client with robust retry logic and async worker pattern
@@ -233,6 +237,22 @@ impl BitcoinRpcClient {
             .map_err(|_| RpcError::ConnectionFailed("RPC worker channel closed".to_string()))?
     }
 
+    /// Get block header as JSON (includes time; no tx list, served from the block index)
+    pub async fn get_block_header(&self, block_hash: &str) -> RpcResult<serde_json::Value> {
+        let (tx, rx) = oneshot::channel();
+
+        self.request_tx
+            .send(RpcRequest::GetBlockHeader {
+                block_hash: block_hash.to_string(),
+                tx,
+            })
+            .await
+            .map_err(|_| RpcError::ConnectionFailed("Failed to send RPC request".to_string()))?;
+
+        rx.await
+            .map_err(|_| RpcError::ConnectionFailed("RPC worker channel closed".to_string()))?
+    }
+
     /// Get transaction with verbose JSON output (includes blockhash, confirmations, etc.)
     pub async fn get_transaction_verbose(&self, txid: &str) -> RpcResult<serde_json::Value> {
         let (tx, rx) = oneshot::channel();
@@ -394,6 +414,10 @@ impl RpcWorker {
                 let result = self.get_block_hash_impl(height).await;
                 let _ = tx.send(result);
             }
+            RpcRequest::GetBlockHeader { block_hash, tx } => {
+                let result = self.get_block_header_impl(&block_hash).await;
+                let _ = tx.send(result);
+            }
         }
     }
 
@@ -689,6 +713,45 @@ impl RpcWorker {
             }),
         }
     }
+
+    /// Get block header as JSON (getblockheader <blockhash> true)
+    async fn get_block_header_impl(&self, block_hash: &str) -> RpcResult<serde_json::Value> {
+        let client = Arc::clone(&self.client);
+        let block_hash_owned = block_hash.to_string();
+
+        match execute_with_timeout(
+            self.config.timeout_seconds,
+            move || -> RpcResult<serde_json::Value> {
+                let result: serde_json::Value = client
+                    .call(
+                        "getblockheader",
+                        &[
+                            serde_json::json!(block_hash_owned),
+                            serde_json::json!(true), // verbose=true for JSON output
+                        ],
+                    )
+                    .map_err(|e| RpcError::CallFailed {
+                        method: "getblockheader".to_string(),
+                        message: e.to_string(),
+                    })?;
+
+                debug!("Retrieved block header {}", block_hash_owned);
+
+                Ok(result)
+            },
+        )
+        .await
+        {
+            Ok(result) => result.map_err(|e| RpcError::CallFailed {
+                method: "spawn_blocking".to_string(),
+                message: format!("Get block header task failed: {}", e),
+            })?,
+            Err(_) => Err(RpcError::Timeout {
+                timeout_seconds: self.config.timeout_seconds,
+                operation: format!("get_block_header({})", block_hash),
+            }),
+        }
+    }
 }
 
 impl Clone for RpcWorker {
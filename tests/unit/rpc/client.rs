@@ -107,6 +107,9 @@ async fn test_rpc_channel_communication() -> Result<()> {
                 RpcRequest::GetBlockHash { .. } => {
                     // Not used in this test
                 }
+                RpcRequest::GetBlockHeader { .. } => {
+                    // Not used in this test
+                }
             }
         }
     });
@@ -60,6 +60,21 @@ async fn test_schema_initialisation() -> Result<()> {
     Ok(())
 }
 
+#[tokio::test]
+async fn test_connection_pragmas_applied() -> Result<()> {
+    let test_db = TestDatabase::new("connection_pragmas")?;
+    let conn = test_db.database().connection();
+
+    let cache_size: i64 = conn.query_row("PRAGMA cache_size", [], |row| row.get(0))?;
+    assert_eq!(cache_size, -262144, "page cache should be 256 MiB");
+
+    // 2 = MEMORY
+    let temp_store: i64 = conn.query_row("PRAGMA temp_store", [], |row| row.get(0))?;
+    assert_eq!(temp_store, 2, "temporaries should be kept in memory");
+
+    Ok(())
+}
+
 #[tokio::test]
 async fn test_stub_blocks_creation() -> Result<()> {
     let mut test_db = TestDatabase::new("stub_blocks")?;